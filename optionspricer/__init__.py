@@ -0,0 +1,27 @@
+"""
+optionspricer : European and American option pricing (Black-Scholes,
+binomial tree, Monte Carlo, Heston) and Yahoo Finance market data.
+
+Public names are resolved lazily: pricing code never pays for the market
+data dependencies (pandas, yfinance, requests) unless it uses them.
+"""
+
+from optionspricer._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules={"mark_to_model", "pricer", "products"},
+    attributes={
+        "BlackScholesPricer": "pricer.blackscholes",
+        "BinomialPricer": "pricer.binomial",
+        "HestonPricer": "pricer.heston",
+        "HestonCalibrator": "pricer.heston",
+        "MarkToModel": "mark_to_model",
+        "MonteCarlo": "pricer.montecarlo",
+        "MultiAssetMonteCarlo": "pricer.multiasset",
+        "PricingCache": "pricer.cache",
+        "Option": "products.option",
+        "Product": "products.underlying",
+        "MultiCurrencyRiskFreeRate": "products.risk_free_rate",
+    },
+)
@@ -0,0 +1,46 @@
+"""
+Lazy attribute loading for the package facades (PEP 562).
+
+Each ``__init__`` declares which public names live in which submodule; the
+submodule is only imported the first time one of its names is accessed, so
+``import optionspricer`` stays cheap and does not pull in scipy, pandas,
+yfinance or requests until they are actually needed.
+"""
+
+import importlib
+
+
+def attach(package: str, submodules: set, attributes: dict):
+    """
+    Build the ``__getattr__``, ``__dir__`` and ``__all__`` of a package.
+
+    Parameters:
+    -----------
+    package : str
+        ``__name__`` of the package using the facade
+    submodules : set
+        Names of subpackages / modules reachable as attributes
+    attributes : dict
+        Mapping ``public name -> submodule`` where the name is defined
+
+    Returns:
+    --------
+    tuple : (__getattr__, __dir__, __all__)
+    """
+    __all__ = sorted(set(submodules) | set(attributes))
+
+    def __getattr__(name: str):
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in attributes:
+            module = importlib.import_module(f"{package}.{attributes[name]}")
+            value = getattr(module, name)
+            # Cache on the package so later lookups bypass __getattr__
+            setattr(importlib.import_module(package), name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return list(__all__)
+
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,220 @@
+"""
+Historical mark-to-model of option contracts over an underlying's price history.
+
+Replaces the row by row `etf_data.apply(lambda row: BlackScholesPricer()...)`
+pattern: prices and Greeks are computed as (dates x contracts) arrays with the
+vectorized Black-Scholes formulas, one chunk of dates at a time so memory stays
+bounded on long, multi-ticker histories. Histories can be in-memory DataFrames
+(e.g. from `Product.get_stock_data`) or streamed from Parquet files.
+
+Methods:
+rolling_volatility(close: pd.Series, window: int) -> pd.Series:
+    Annualized rolling volatility of daily log returns.
+
+read_parquet_history(path: str, batch_size: int):
+    Stream a price history stored in Parquet as DataFrame batches.
+
+MarkToModel.iter_chunks(history):
+    Yield the price / Greeks panel chunk by chunk.
+
+MarkToModel.run(history) -> pd.DataFrame:
+    Full panel, indexed by date with (measure, contract) columns.
+"""
+
+import numpy as np
+import pandas as pd
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+
+MEASURES = ["price", "delta", "gamma", "vega", "theta", "rho"]
+
+
+def rolling_volatility(close: pd.Series, window: int = 20) -> pd.Series:
+    """Annualized rolling standard deviation of daily log returns."""
+    log_return = np.log(close / close.shift(1))
+    return log_return.rolling(window=window).std() * np.sqrt(252)
+
+
+def read_parquet_history(path: str, batch_size: int = 65536, columns=None):
+    """
+    Stream a price history saved with `DataFrame.to_parquet` batch by batch.
+
+    path: Parquet file, rows sorted by date
+    columns: columns to read (defaults to all); the date index is always kept
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    if columns is not None:
+        index_columns = [
+            c for c in (parquet_file.schema_arrow.pandas_metadata or {}).get("index_columns", [])
+            if isinstance(c, str)
+        ]
+        columns = list(columns) + [c for c in index_columns if c not in columns]
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
+
+
+def _as_dates(index) -> np.ndarray:
+    """Calendar dates (datetime64[D]) of a DatetimeIndex, timezone dropped."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype("datetime64[D]")
+
+
+def _align(value, index) -> np.ndarray:
+    """Scalar or date-indexed Series (rates, dividend yield) -> array on `index`."""
+    if isinstance(value, pd.Series):
+        value = value.copy()
+        value.index = pd.DatetimeIndex(_as_dates(value.index))
+        dates = pd.DatetimeIndex(_as_dates(index))
+        return value.sort_index().reindex(dates, method="ffill").to_numpy(dtype=float)
+    return np.full(len(index), 0.0 if value is None else float(value))
+
+
+class MarkToModel:
+
+    def __init__(
+        self,
+        contracts,
+        r,
+        q=0.0,
+        vol_window: int = 20,
+        chunk_size: int = 252,
+    ):
+        """
+        contracts: DataFrame indexed by contract id (or list of dicts with an
+                   'id' key) with columns 'strike', 'expiry', 'option_type' and,
+                   for several underlyings, 'underlying'
+        r: risk-free rate, scalar or Series indexed by date
+        q: dividend yield, scalar or Series indexed by date
+        vol_window: window (in days) of the rolling volatility, used when the
+                    history has no 'vol' column
+        chunk_size: number of dates priced at once
+        """
+        if not isinstance(contracts, pd.DataFrame):
+            contracts = pd.DataFrame(list(contracts)).set_index("id")
+        missing = {"strike", "expiry", "option_type"} - set(contracts.columns)
+        if missing:
+            raise ValueError(f"Missing contract columns: {sorted(missing)}")
+        if not contracts["option_type"].str.lower().isin(["call", "put"]).all():
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        self.contracts = contracts
+        self.r = r
+        self.q = q
+        self.vol_window = vol_window
+        self.chunk_size = chunk_size
+
+    def _price_chunk(self, history: pd.DataFrame, contracts: pd.DataFrame) -> pd.DataFrame:
+        """Price and Greeks of `contracts` on every date of `history`."""
+        dates = _as_dates(history.index)
+        spot = history["Close"].to_numpy(dtype=float)[:, None]
+        sigma = history["vol"].to_numpy(dtype=float)[:, None]
+        r = _align(self.r, history.index)[:, None]
+        q = _align(self.q, history.index)[:, None]
+
+        expiry = pd.to_datetime(contracts["expiry"]).to_numpy().astype("datetime64[D]")
+        T = (expiry[None, :] - dates[:, None]).astype(float) / 365
+        strike = contracts["strike"].to_numpy(dtype=float)[None, :]
+        is_call = contracts["option_type"].str.lower().to_numpy() == "call"
+
+        panel = {measure: np.full(T.shape, np.nan) for measure in MEASURES}
+        # Contrats vivants avec une volatilité disponible
+        alive = (T > 0) & np.isfinite(sigma) & (sigma > 0)
+        T_safe = np.where(alive, T, 1.0)
+        sigma_safe = np.where(alive, sigma, 1.0)
+
+        pricer = BlackScholesPricer()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for option_type, columns in [("call", is_call), ("put", ~is_call)]:
+                if not columns.any():
+                    continue
+                args = (
+                    spot,
+                    strike[:, columns],
+                    T_safe[:, columns],
+                    r,
+                    q,
+                    sigma_safe[:, columns],
+                )
+                values = pricer.calculate_greeks(*args, option_type=option_type)
+                values["price"] = pricer.price(*args, option_type, "european")
+                for measure in MEASURES:
+                    panel[measure][:, columns] = np.where(
+                        alive[:, columns], values[measure], np.nan
+                    )
+
+                # Jour d'échéance : valeur intrinsèque, delta 0 ou +-1, autres grecques nulles
+                sign = 1 if option_type == "call" else -1
+                expiring = T[:, columns] == 0
+                moneyness = sign * (spot - strike[:, columns])
+                intrinsic = {
+                    "price": np.maximum(moneyness, 0),
+                    "delta": sign * (moneyness > 0).astype(float),
+                }
+                for measure in MEASURES:
+                    panel[measure][:, columns] = np.where(
+                        expiring, intrinsic.get(measure, 0.0), panel[measure][:, columns]
+                    )
+
+        return pd.concat(
+            {
+                measure: pd.DataFrame(panel[measure], index=history.index, columns=contracts.index)
+                for measure in MEASURES
+            },
+            axis=1,
+        )
+
+    def _iter_underlying(self, history, contracts: pd.DataFrame):
+        """Chunks for the contracts of one underlying (DataFrame or stream of DataFrames)."""
+        if isinstance(history, pd.DataFrame):
+            history = [history]
+
+        # Queue des cours précédents pour que la vol glissante soit continue d'un chunk à l'autre
+        tail = None
+        for frame in history:
+            if frame.empty:
+                continue
+            for start in range(0, len(frame), self.chunk_size):
+                chunk = frame.iloc[start:start + self.chunk_size]
+                if "vol" not in chunk.columns:
+                    close = chunk["Close"] if tail is None else pd.concat([tail, chunk["Close"]])
+                    vol = rolling_volatility(close, self.vol_window).iloc[-len(chunk):]
+                    chunk = chunk.assign(vol=vol.to_numpy())
+                    tail = close.iloc[-self.vol_window:]
+                yield self._price_chunk(chunk, contracts)
+
+    def iter_chunks(self, history):
+        """
+        Yield the mark-to-model panel chunk by chunk.
+
+        history: price history with a 'Close' column (and optionally 'vol')
+                 indexed by date, as a DataFrame, an iterable of DataFrames
+                 (e.g. `read_parquet_history`), or a dict {underlying: history}
+                 matching the 'underlying' column of the contracts.
+        """
+        if isinstance(history, dict):
+            if "underlying" not in self.contracts.columns:
+                raise ValueError("Contracts need an 'underlying' column for several histories.")
+            for underlying, underlying_history in history.items():
+                contracts = self.contracts[self.contracts["underlying"] == underlying]
+                if not contracts.empty:
+                    yield from self._iter_underlying(underlying_history, contracts)
+        else:
+            yield from self._iter_underlying(history, self.contracts)
+
+    def run(self, history) -> pd.DataFrame:
+        """
+        Full mark-to-model panel: one row per date, (measure, contract) columns.
+        Greeks follow `BlackScholesPricer.calculate_greeks` conventions. On
+        its expiry date a contract is marked at intrinsic value; after it,
+        and before the rolling volatility is available, values are NaN.
+        """
+        chunks = list(self.iter_chunks(history))
+        if not chunks:
+            raise ValueError("Empty price history.")
+        panel = pd.concat(chunks)
+        if isinstance(history, dict):
+            panel = panel.groupby(level=0).first().sort_index()
+        return panel.reindex(columns=pd.MultiIndex.from_product([MEASURES, self.contracts.index]))
@@ -0,0 +1,20 @@
+"""
+Pricing engines. Only numpy (and scipy.special on first use) is required;
+nothing here depends on pandas or the network.
+"""
+
+from optionspricer._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules={"binomial", "blackscholes", "cache", "heston", "montecarlo", "multiasset"},
+    attributes={
+        "BinomialPricer": "binomial",
+        "BlackScholesPricer": "blackscholes",
+        "HestonCalibrator": "heston",
+        "HestonPricer": "heston",
+        "MonteCarlo": "montecarlo",
+        "MultiAssetMonteCarlo": "multiasset",
+        "PricingCache": "cache",
+    },
+)
@@ -1,4 +1,16 @@
 import math
+import warnings
+
+import numpy as np
+
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+
+
+def _peizer_pratt(z, n):
+    """Inversion de Peizer-Pratt (méthode 2) utilisée par Leisen-Reimer."""
+    return 0.5 + math.copysign(1, z) * 0.5 * math.sqrt(
+        1 - math.exp(-((z / (n + 1 / 3 + 0.1 / (n + 1))) ** 2) * (n + 1 / 6))
+    )
 
 
 class BinomialPricer:
@@ -30,6 +42,7 @@ class BinomialPricer:
         N             : nombre d'étapes dans l'arbre binomial.
                         On peut augmenter le nombre d’étapes N pour améliorer la précision.
                         Attention cependant au coût de calcul (complexité O(N^2)).
+                        Voir `price_to_tolerance` pour choisir N automatiquement.
         option_type   : 'call' ou 'put'
         style : 'american' ou 'european'
 
@@ -88,3 +101,206 @@ class BinomialPricer:
 
         # La valeur en 0,0 est le prix de l'option
         return option_values[0]
+
+    @staticmethod
+    def lattice(
+        S: int | float,
+        K: int | float,
+        r: float,
+        T: float,
+        q: float,
+        sigma: float,
+        N: int,
+        option_type: str,
+        style: str,
+        tree: str = "crr",
+    ):
+        """
+        Version vectorisée (numpy) de `price`, avec le choix de l'arbre.
+
+        tree : 'crr' : Cox, Ross et Rubinstein (identique à `price`)
+               'bbs' : arbre CRR lissé de Broadie-Detemple, la dernière étape
+                       est remplacée par le prix Black-Scholes (convergence
+                       régulière, sans oscillation autour du strike)
+               'lr'  : Leisen-Reimer, convergence en O(1/N^2) pour les
+                       options européennes. N est arrondi au nombre impair
+                       supérieur.
+        """
+        levels, _, _ = BinomialPricer._sweep(
+            S, K, r, T, q, sigma, N, option_type, style, tree
+        )
+        return float(levels[0][0])
+
+    @staticmethod
+    def greeks(
+        S: int | float,
+        K: int | float,
+        r: float,
+        T: float,
+        q: float,
+        sigma: float,
+        N: int,
+        option_type: str,
+        style: str,
+        tree: str = "crr",
+    ):
+        """
+        Prix, delta, gamma et theta lus sur les premiers noeuds de l'arbre,
+        pendant la même remontée que le prix (aucune revalorisation).
+
+        Retour :
+        --------
+        dict : 'price', 'delta', 'gamma' et 'theta' (theta journalier, même
+               convention que `BlackScholesPricer.calculate_greeks`)
+        """
+        if N < 3:
+            raise ValueError("Il faut au moins 3 étapes pour calculer les grecques.")
+        levels, stock_prices, dt = BinomialPricer._sweep(
+            S, K, r, T, q, sigma, N, option_type, style, tree
+        )
+        V0, V1, V2 = levels[0], levels[1], levels[2]
+        S1, S2 = stock_prices(1), stock_prices(2)
+
+        delta = (V1[0] - V1[1]) / (S1[0] - S1[1])
+        delta_up = (V2[0] - V2[1]) / (S2[0] - S2[1])
+        delta_down = (V2[1] - V2[2]) / (S2[1] - S2[2])
+        gamma = (delta_up - delta_down) / ((S2[0] - S2[2]) / 2)
+        # Noeud central à t = 2 dt ramené en S (correction nulle pour CRR et BBS)
+        shift = S - S2[1]
+        V_center = V2[1] + delta * shift + 0.5 * gamma * shift**2
+        theta = (V_center - V0[0]) / (2 * dt)
+
+        return {
+            "price": float(V0[0]),
+            "delta": float(delta),
+            "gamma": float(gamma),
+            "theta": float(theta) / 365,  # Converting to daily theta
+        }
+
+    @staticmethod
+    def _sweep(S, K, r, T, q, sigma, N, option_type, style, tree):
+        """
+        Remontée de l'arbre. Retourne les valeurs de l'option aux étapes 0, 1
+        et 2, la fonction donnant les prix du sous-jacent à une étape, et dt.
+        """
+        if q is None:
+            q = 0
+        if option_type not in ["call", "put"]:
+            raise ValueError("option_type doit être 'call' ou 'put'.")
+        if tree not in ["crr", "bbs", "lr"]:
+            raise ValueError("tree doit être 'crr', 'bbs' ou 'lr'.")
+
+        if tree == "lr" and N % 2 == 0:
+            N += 1
+        dt = T / N
+        growth = math.exp((r - q) * dt)
+        if tree == "lr":
+            d1 = (math.log(S / K) + (r - q + sigma**2 / 2) * T) / (sigma * math.sqrt(T))
+            d2 = d1 - sigma * math.sqrt(T)
+            p = _peizer_pratt(d2, N)
+            u = growth * _peizer_pratt(d1, N) / p
+            d = (growth - p * u) / (1 - p)
+        else:
+            u = math.exp(sigma * math.sqrt(dt))
+            d = 1 / u
+            p = (growth - d) / (u - d)
+        discount = math.exp(-r * dt)
+        sign = 1 if option_type == "call" else -1
+
+        def stock_prices(step):
+            # i = nombre de baisses, comme dans `price`
+            i = np.arange(step + 1)
+            return S * u ** (step - i) * d**i
+
+        if tree == "bbs":
+            # Valeur analytique sur le dernier pas de temps
+            last = N - 1
+            prices = stock_prices(last)
+            option_values = BlackScholesPricer().price(
+                prices, K, dt, r, q, sigma, option_type, "european"
+            )
+            if style == "american":
+                option_values = np.maximum(option_values, np.maximum(sign * (prices - K), 0))
+        else:
+            last = N
+            option_values = np.maximum(sign * (stock_prices(N) - K), 0)
+
+        levels = {last: option_values}
+        for step in range(last - 1, -1, -1):
+            option_values = discount * (p * option_values[:-1] + (1 - p) * option_values[1:])
+            if style == "american":
+                option_values = np.maximum(
+                    option_values, np.maximum(sign * (stock_prices(step) - K), 0)
+                )
+            if step <= 2:
+                levels[step] = option_values
+
+        return levels, stock_prices, dt
+
+    @staticmethod
+    def price_to_tolerance(
+        S: int | float,
+        K: int | float,
+        r: float,
+        T: float,
+        q: float,
+        sigma: float,
+        option_type: str,
+        style: str,
+        tol: float = 1e-3,
+        method: str = "bbsr",
+        N_start: int = 25,
+        N_max: int = 3200,
+    ):
+        """
+        Choisit automatiquement le nombre d'étapes pour atteindre une précision.
+
+        On double N à partir de N_start jusqu'à ce que deux estimations
+        successives diffèrent de moins de tol.
+
+        method : 'bbsr' : arbre BBS avec extrapolation de Richardson
+                          2 * V(N) - V(N / 2) (Broadie-Detemple)
+                 'lr'   : arbre de Leisen-Reimer (N arrondi à l'impair inférieur)
+        N_start: nombre d'étapes initial, au moins 2
+        N_max  : nombre d'étapes jamais dépassé, au moins 2 * N_start
+
+        Retour :
+        --------
+        dict : 'price', 'error' (estimation de l'erreur) et 'N' (nombre
+               d'étapes du dernier arbre utilisé)
+        """
+        if method == "bbsr":
+            def estimate(N):
+                coarse = BinomialPricer.lattice(S, K, r, T, q, sigma, N // 2, option_type, style, "bbs")
+                fine = BinomialPricer.lattice(S, K, r, T, q, sigma, N, option_type, style, "bbs")
+                return 2 * fine - coarse
+        elif method == "lr":
+            def estimate(N):
+                # Arrondi au nombre impair inférieur pour ne jamais dépasser N_max
+                return BinomialPricer.lattice(S, K, r, T, q, sigma, N - 1 + N % 2, option_type, style, "lr")
+        else:
+            raise ValueError("method doit être 'bbsr' ou 'lr'.")
+        if N_start < 2:
+            raise ValueError("N_start doit être au moins égal à 2.")
+        if 2 * N_start > N_max:
+            raise ValueError("N_max doit être au moins égal à 2 * N_start.")
+
+        N = N_start
+        previous = estimate(N)
+        while True:
+            N *= 2
+            current = estimate(N)
+            error = abs(current - previous)
+            if error < tol:
+                break
+            # On ne double N que si le nouvel arbre reste sous N_max
+            if N * 2 > N_max:
+                warnings.warn(
+                    f"Tolérance {tol} non atteinte avec N = {N} (erreur estimée {error:.2e})."
+                )
+                break
+            previous = current
+
+        if method == "lr":
+            N -= 1 - N % 2  # nombre impair effectivement utilisé
+        return {"price": current, "error": error, "N": N}
@@ -1,10 +1,22 @@
 import numpy as np
-from scipy.stats import norm
+
+
+def norm_cdf(x):
+    """Standard normal CDF. scipy.special is imported on first call only
+    (importing scipy.stats at module level costs about a second)."""
+    from scipy.special import ndtr
+
+    return ndtr(x)
+
+
+def norm_pdf(x):
+    """Standard normal density."""
+    return np.exp(-0.5 * np.square(x)) / np.sqrt(2 * np.pi)
 
 
 class BlackScholesPricer:
     def __init__(self):
-        self.N = norm.cdf
+        self.N = norm_cdf
 
     def price(
         self,
@@ -47,7 +59,7 @@ class BlackScholesPricer:
             )
         else:
             # Ensure T is positive
-            T = max(T, 1e-10)  # Avoid division by zero
+            T = np.maximum(T, 1e-10)  # Avoid division by zero, works on arrays
 
             d1 = (np.log(S / K) + (r - q + sigma**2 / 2) * T) / (sigma * np.sqrt(T))
             d2 = d1 - sigma * np.sqrt(T)
@@ -89,13 +101,13 @@ class BlackScholesPricer:
         d2 = d1 - sigma * np.sqrt(T)
 
         # Calculate normal probability density
-        N_prime = norm.pdf
+        N_prime = norm_pdf
 
         # Delta
         if option_type.lower() == "call":
-            delta = norm.cdf(d1)
+            delta = norm_cdf(d1)
         else:
-            delta = -norm.cdf(-d1)
+            delta = -norm_cdf(-d1)
 
         # Gamma
         gamma = N_prime(d1) / (S * sigma * np.sqrt(T))
@@ -104,20 +116,20 @@ class BlackScholesPricer:
         if option_type.lower() == "call":
             theta = -S * N_prime(d1) * sigma / (2 * np.sqrt(T)) - r * K * np.exp(
                 -r * T
-            ) * norm.cdf(d2)
+            ) * norm_cdf(d2)
         else:
             theta = -S * N_prime(d1) * sigma / (2 * np.sqrt(T)) + r * K * np.exp(
                 -r * T
-            ) * norm.cdf(-d2)
+            ) * norm_cdf(-d2)
 
         # Vega (same for calls and puts)
         vega = S * np.sqrt(T) * N_prime(d1)
 
         # Rho
         if option_type.lower() == "call":
-            rho = K * T * np.exp(-r * T) * norm.cdf(d2)
+            rho = K * T * np.exp(-r * T) * norm_cdf(d2)
         else:
-            rho = -K * T * np.exp(-r * T) * norm.cdf(-d2)
+            rho = -K * T * np.exp(-r * T) * norm_cdf(-d2)
 
         return {
             "delta": delta,
@@ -0,0 +1,142 @@
+"""
+Memoizing cache for pricing functions.
+
+Quoting and risk loops reprice the same contracts with identical or nearly
+identical inputs; `PricingCache.wrap` returns a drop-in replacement of any
+pricer function whose results are reused for inputs falling on the same
+tick grid. The cache is bounded (LRU, optional TTL), keeps hit-rate
+statistics and can be shared between threads.
+
+Example:
+    cache = PricingCache(maxsize=10_000, ticks={"S": 0.01, "sigma": 1e-4})
+    price = cache.wrap(BinomialPricer.price)
+    price(S, K, r, T, q, sigma, N=500, option_type="put", style="american")
+"""
+
+import functools
+import inspect
+import numbers
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PricingCache:
+
+    def __init__(self, maxsize: int = 4096, ttl: float | None = None, ticks: dict | None = None):
+        """
+        maxsize: maximum number of cached results, least recently used are
+                 evicted first
+        ttl: lifetime of a cached result in seconds (None: no expiry)
+        ticks: tick size per argument name, e.g. {"S": 0.01, "sigma": 1e-4}.
+               Inputs are rounded to the nearest tick before pricing, so all
+               calls within half a tick share one result. Arguments without
+               a tick must match exactly.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ticks = dict(ticks or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _quantize(self, arguments: dict) -> dict:
+        """Round the arguments with a tick size to the tick grid."""
+        quantized = dict(arguments)
+        for name, tick in self.ticks.items():
+            value = quantized.get(name)
+            # numbers.Real couvre aussi les scalaires numpy (np.int64, np.float64)
+            if isinstance(value, numbers.Real) and not isinstance(value, (bool, np.bool_)):
+                # round(., 12) évite les artefacts binaires (0.1 * 3 != 0.3)
+                quantized[name] = round(round(float(value) / tick) * tick, 12)
+        return quantized
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def _set(self, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def wrap(self, pricer, engine=None):
+        """
+        Return a cached version of `pricer` (any function or bound method,
+        e.g. `BinomialPricer.price`, `BlackScholesPricer().price`,
+        `MonteCarlo.greeks`). Calls with unhashable arguments (arrays) are
+        passed through without caching.
+
+        engine: hashable key identifying the pricer. By default each call to
+                `wrap` gets its own entries, so two instances of the same
+                class (e.g. HestonPricer with different n_terms) never share
+                results. Wrappers given the same engine share their entries.
+        """
+        signature = inspect.signature(pricer)
+        if engine is None:
+            engine = object()
+
+        @functools.wraps(pricer)
+        def cached(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            bound.arguments.update(self._quantize(bound.arguments))
+            key = (engine, tuple(bound.arguments.items()))
+            try:
+                hash(key)
+            except TypeError:
+                return pricer(*args, **kwargs)
+
+            found, value = self._get(key)
+            if not found:
+                # Calcul hors du verrou : les autres threads ne sont pas bloqués
+                value = pricer(*bound.args, **bound.kwargs)
+                self._set(key, value)
+            # Copie pour que l'appelant ne modifie pas le résultat en cache
+            if isinstance(value, (dict, np.ndarray)):
+                return value.copy()
+            return value
+
+        cached.cache = self
+        return cached
+
+    def clear(self):
+        """Drop all cached results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Hits, misses, hit rate, evictions and current size."""
+        with self._lock:
+            calls = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / calls if calls else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
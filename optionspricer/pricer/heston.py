@@ -0,0 +1,289 @@
+"""
+Heston (and Bates) stochastic volatility model priced with the COS method
+(Fang & Oosterlee, 2008).
+
+The COS expansion only depends on the strike through exp(i u_k x), so every
+strike of an expiry is priced with one matrix product against the same
+characteristic function values. HestonCalibrator uses this to fit a whole
+option surface with vectorized residuals.
+"""
+
+import numpy as np
+
+PARAM_NAMES = ("v0", "kappa", "theta", "xi", "rho")
+BATES_PARAM_NAMES = ("lam", "mu_j", "sigma_j")
+
+# Point de départ générique de la calibration
+DEFAULT_PARAMS = {
+    "v0": 0.04,
+    "kappa": 1.5,
+    "theta": 0.04,
+    "xi": 0.5,
+    "rho": -0.6,
+    "lam": 0.1,
+    "mu_j": -0.05,
+    "sigma_j": 0.1,
+}
+
+# Borne basse / haute des paramètres pour l'optimiseur
+PARAM_BOUNDS = {
+    "v0": (1e-4, 4.0),
+    "kappa": (1e-3, 20.0),
+    "theta": (1e-4, 4.0),
+    "xi": (1e-3, 5.0),
+    "rho": (-0.999, 0.999),
+    "lam": (0.0, 5.0),
+    "mu_j": (-1.0, 1.0),
+    "sigma_j": (1e-4, 1.0),
+}
+
+
+class HestonPricer:
+
+    def __init__(self, n_terms: int = 256, L: float = 16.0):
+        """
+        n_terms : number of terms in the cosine expansion
+        L       : width of the truncation range, in standard deviations
+                  of log(S_T / S)
+        """
+        self.n_terms = n_terms
+        self.L = L
+
+    @staticmethod
+    def characteristic_function(
+        u, T, r, q, v0, kappa, theta, xi, rho, lam=0.0, mu_j=0.0, sigma_j=0.0
+    ):
+        """
+        Characteristic function of log(S_T / S) under the risk-neutral measure.
+        Uses the "little Heston trap" formulation (Albrecher et al.), which is
+        continuous in u for long maturities. lam, mu_j, sigma_j add Merton
+        lognormal jumps (Bates model); lam = 0 gives plain Heston.
+        """
+        u = np.asarray(u, dtype=complex)
+        iu = 1j * u
+        beta = kappa - rho * xi * iu
+        d = np.sqrt(beta**2 + xi**2 * (iu + u**2))
+        g = (beta - d) / (beta + d)
+        exp_dT = np.exp(-d * T)
+
+        C = (r - q) * iu * T + kappa * theta / xi**2 * (
+            (beta - d) * T - 2 * np.log((1 - g * exp_dT) / (1 - g))
+        )
+        D = (beta - d) / xi**2 * (1 - exp_dT) / (1 - g * exp_dT)
+        phi = np.exp(C + D * v0)
+
+        if lam:
+            jump_mean = np.exp(mu_j + 0.5 * sigma_j**2) - 1
+            phi = phi * np.exp(
+                lam * T * (np.exp(iu * mu_j - 0.5 * sigma_j**2 * u**2) - 1)
+                - iu * lam * T * jump_mean
+            )
+        return phi
+
+    @staticmethod
+    def _cumulants(T, r, q, v0, kappa, theta, xi, rho, lam, mu_j, sigma_j):
+        """First two cumulants of log(S_T / S), used for the truncation range."""
+        e = np.exp(-kappa * T)
+        c1 = (r - q) * T + (1 - e) * (theta - v0) / (2 * kappa) - 0.5 * theta * T
+        c2 = (
+            xi * T * kappa * e * (v0 - theta) * (8 * kappa * rho - 4 * xi)
+            + kappa * rho * xi * (1 - e) * (16 * theta - 8 * v0)
+            + 2 * theta * kappa * T * (-4 * kappa * rho * xi + xi**2 + 4 * kappa**2)
+            + xi**2 * ((theta - 2 * v0) * e**2 + theta * (6 * e - 7) + 2 * v0)
+            + 8 * kappa**2 * (v0 - theta) * (1 - e)
+        ) / (8 * kappa**3)
+        if lam:
+            c1 += lam * T * (mu_j - np.exp(mu_j + 0.5 * sigma_j**2) + 1)
+            c2 += lam * T * (mu_j**2 + sigma_j**2)
+        return c1, abs(c2)
+
+    def price(
+        self,
+        S: int | float,
+        K,
+        T: float,
+        r: float,
+        q: float,
+        v0: float,
+        kappa: float,
+        theta: float,
+        xi: float,
+        rho: float,
+        option_type: str,
+        lam: float = 0.0,
+        mu_j: float = 0.0,
+        sigma_j: float = 0.0,
+    ):
+        """
+        Price European options under Heston / Bates with the COS method.
+
+        Parameters:
+        -----------
+        S : float
+            Current stock price
+        K : float or array
+            Strike price(s); all strikes are priced in one pass
+        T : float
+            Time to maturity (in years)
+        r : float
+            Risk-free rate (annual)
+        q : dividend yield annualized
+        v0 : float
+            Initial variance
+        kappa : float
+            Mean reversion speed of the variance
+        theta : float
+            Long term variance
+        xi : float
+            Volatility of variance
+        rho : float
+            Correlation between the stock and variance Brownian motions
+        option_type : str
+            Type of option - 'call' or 'put'
+        lam, mu_j, sigma_j : float
+            Jump intensity, mean and volatility of log jump sizes (Bates)
+
+        Returns:
+        --------
+        float or np.ndarray : Option price(s), same shape as K
+        """
+        if q is None:
+            q = 0
+        if option_type.lower() not in ["call", "put"]:
+            raise ValueError("option_type must be 'call' or 'put'")
+
+        K = np.asarray(K, dtype=float)
+        x = np.log(S / K).reshape(-1)
+
+        c1, c2 = self._cumulants(T, r, q, v0, kappa, theta, xi, rho, lam, mu_j, sigma_j)
+        # L écarts-types, élargi pour contenir les strikes très en dehors de la monnaie
+        width = self.L * np.sqrt(c2) + np.max(np.abs(x))
+        a = c1 - width
+        b = c1 + width
+
+        k = np.arange(self.n_terms)
+        u = k * np.pi / (b - a)
+        phi = self.characteristic_function(
+            u, T, r, q, v0, kappa, theta, xi, rho, lam, mu_j, sigma_j
+        )
+
+        # Coefficients du payoff put sur [a, 0] (plus stable que le call)
+        chi = (
+            np.cos(-u * a) - np.exp(a) + u * np.sin(-u * a)
+        ) / (1 + u**2)
+        psi = np.empty(self.n_terms)
+        psi[0] = -a
+        psi[1:] = np.sin(-u[1:] * a) / u[1:]
+        U = 2 / (b - a) * (psi - chi)
+
+        terms = phi * U
+        terms[0] *= 0.5
+        # Une ligne par strike : exp(i u_k (x - a))
+        put = K.reshape(-1) * np.exp(-r * T) * np.real(
+            np.exp(1j * np.outer(x - a, u)) @ terms
+        )
+        put = np.maximum(put, 0.0)
+
+        if option_type.lower() == "call":
+            # Parité call-put
+            price = put + S * np.exp(-q * T) - K.reshape(-1) * np.exp(-r * T)
+        else:
+            price = put
+
+        price = price.reshape(K.shape)
+        return float(price) if price.ndim == 0 else price
+
+
+class HestonCalibrator:
+
+    def __init__(self, S: int | float, r: float, q: float = 0.0, bates: bool = False,
+                 pricer: HestonPricer | None = None):
+        """
+        Fit Heston (or Bates) parameters to a surface of European quotes.
+
+        The last calibrated parameters are kept in `params` and used as the
+        starting point of the next `calibrate` call, so recalibrating on the
+        next day's surface starts from yesterday's solution.
+        """
+        self.S = S
+        self.r = r
+        self.q = 0 if q is None else q
+        self.bates = bates
+        self.pricer = pricer if pricer is not None else HestonPricer()
+        self.names = PARAM_NAMES + (BATES_PARAM_NAMES if bates else ())
+        self.params = None
+
+    @staticmethod
+    def quotes_from_chain(chain, T: float, option_type: str):
+        """
+        Build a quote tuple from a `Product.calls_puts_for_maturity` table.
+        Mid prices are used; strikes without a bid are dropped.
+        """
+        bid = np.asarray(chain["bid"], dtype=float)
+        ask = np.asarray(chain["ask"], dtype=float)
+        strikes = np.asarray(chain["strike"], dtype=float)
+        mask = (bid > 0) & (ask >= bid)
+        return (T, strikes[mask], 0.5 * (bid[mask] + ask[mask]), option_type)
+
+    def _residuals(self, x, quotes, weights):
+        params = dict(zip(self.names, x))
+        model = np.concatenate(
+            [
+                self.pricer.price(self.S, K, T, self.r, self.q, option_type=option_type, **params)
+                for T, K, _, option_type in quotes
+            ]
+        )
+        market = np.concatenate([prices for _, _, prices, _ in quotes])
+        return (model - market) * weights
+
+    def calibrate(self, quotes, x0: dict | None = None, weights=None, **kwargs):
+        """
+        Calibrate the model to market prices.
+
+        Parameters:
+        -----------
+        quotes : list of tuples
+            (T, strikes, prices, option_type) per expiry, see `quotes_from_chain`
+        x0 : dict, optional
+            Starting parameters. Defaults to the previous calibration result,
+            or a generic guess on the first call. Missing parameters (e.g.
+            jumps when starting a Bates fit from Heston parameters) take
+            their generic value.
+        weights : array, optional
+            Weight of each quote in the least squares objective
+            (e.g. 1 / bid-ask spread). Defaults to 1.
+        kwargs : passed to scipy.optimize.least_squares
+
+        Returns:
+        --------
+        dict : Calibrated parameters plus 'rmse' of the unweighted price
+               residuals
+        """
+        from scipy.optimize import least_squares
+
+        quotes = [
+            (float(T), np.asarray(K, dtype=float), np.asarray(p, dtype=float), t)
+            for T, K, p, t in quotes
+        ]
+        n_quotes = sum(len(K) for _, K, _, _ in quotes)
+        weights = np.ones(n_quotes) if weights is None else np.asarray(weights, dtype=float)
+        if weights.shape != (n_quotes,):
+            raise ValueError(f"weights must have one value per quote ({n_quotes})")
+
+        if x0 is None:
+            x0 = self.params
+        # Paramètres absents (ex. Bates démarré depuis un fit Heston) : valeurs par défaut
+        x0 = {**DEFAULT_PARAMS, **(x0 or {})}
+        lower = np.array([PARAM_BOUNDS[n][0] for n in self.names])
+        upper = np.array([PARAM_BOUNDS[n][1] for n in self.names])
+        start = np.clip([x0[n] for n in self.names], lower, upper)
+
+        result = least_squares(
+            self._residuals, start, bounds=(lower, upper), args=(quotes, weights), **kwargs
+        )
+
+        self.params = dict(zip(self.names, result.x.tolist()))
+        # RMSE sur les résidus non pondérés (les poids peuvent être nuls)
+        residuals = self._residuals(result.x, quotes, np.ones(n_quotes))
+        rmse = float(np.sqrt(np.mean(residuals**2)))
+        return {**self.params, "rmse": rmse}
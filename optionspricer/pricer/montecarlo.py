@@ -36,3 +36,83 @@ class MonteCarlo:
         # Discount payoffs to present value
         option_price = np.exp(-r * T) * np.mean(payoffs)
         return option_price
+
+    def greeks(S, K, T, r, q, sigma, n_simulations, option_type='call',
+               method='pathwise', seed=None):
+        """
+        Monte Carlo price and Greeks of a European option from a single set of
+        simulated terminal prices.
+
+        Parameters:
+        - S, K, T, r, q, sigma, n_simulations, option_type: as in `pricer`
+        - method: str, 'pathwise' or 'likelihood_ratio'
+            'pathwise': delta, vega, rho and theta are derivatives of the
+                discounted payoff along each path; gamma uses the mixed
+                likelihood-ratio / pathwise estimator (the pathwise delta
+                is not differentiable at the strike).
+            'likelihood_ratio': delta, gamma, vega and rho weight the payoff
+                by the score of the lognormal density; theta is a one day
+                bump reusing the same draws (common random numbers).
+        - seed: int, optional, seed of the random generator
+
+        Returns:
+        - dict, 'price', 'delta', 'gamma', 'theta', 'vega', 'rho' with the
+          same units as `BlackScholesPricer.calculate_greeks`
+        """
+        if q is None:
+            q=0
+        if option_type not in ['call', 'put']:
+            raise ValueError("option_type must be 'call' or 'put'")
+        if method not in ['pathwise', 'likelihood_ratio']:
+            raise ValueError("method must be 'pathwise' or 'likelihood_ratio'")
+
+        z = np.random.default_rng(seed).standard_normal(n_simulations)
+        sqrt_T = np.sqrt(T)
+        discount = np.exp(-r * T)
+        ST = S * np.exp((r - q - 0.5 * sigma**2) * T + sigma * sqrt_T * z)
+
+        if option_type == 'call':
+            payoffs = np.maximum(ST - K, 0)
+            # Dérivée du payoff par rapport à ST
+            dpayoff = (ST > K).astype(float)
+        else:
+            payoffs = np.maximum(K - ST, 0)
+            dpayoff = -(ST < K).astype(float)
+        price = discount * np.mean(payoffs)
+
+        if method == 'pathwise':
+            delta = discount * np.mean(dpayoff * ST / S)
+            # Gamma identique pour le call et le put (parité call-put)
+            gamma = discount * np.mean((ST > K) * K * z) / (S**2 * sigma * sqrt_T)
+            vega = discount * np.mean(dpayoff * ST * (sqrt_T * z - sigma * T))
+            rho = -T * price + discount * np.mean(dpayoff * ST * T)
+            dST_dT = ST * (r - q - 0.5 * sigma**2 + 0.5 * sigma * z / sqrt_T)
+            theta = r * price - discount * np.mean(dpayoff * dST_dT)
+        else:
+            score = z / (sigma * sqrt_T)
+            delta = discount * np.mean(payoffs * score) / S
+            gamma = discount * np.mean(payoffs * (z**2 - 1 - sigma * sqrt_T * z)) / (
+                S**2 * sigma**2 * T
+            )
+            vega = discount * np.mean(payoffs * ((z**2 - 1) / sigma - sqrt_T * z))
+            rho = discount * np.mean(payoffs * (sqrt_T * z / sigma - T))
+            # Bump d'un jour avec les mêmes tirages z
+            T_bumped = max(T - 1 / 365, 0)
+            ST_bumped = S * np.exp(
+                (r - q - 0.5 * sigma**2) * T_bumped + sigma * np.sqrt(T_bumped) * z
+            )
+            if option_type == 'call':
+                payoffs_bumped = np.maximum(ST_bumped - K, 0)
+            else:
+                payoffs_bumped = np.maximum(K - ST_bumped, 0)
+            price_bumped = np.exp(-r * T_bumped) * np.mean(payoffs_bumped)
+            theta = (price_bumped - price) * 365
+
+        return {
+            'price': price,
+            'delta': delta,
+            'gamma': gamma,
+            'theta': theta / 365,  # Converting to daily theta
+            'vega': vega / 100,  # Converting to 1% vol change
+            'rho': rho / 100,  # Converting to 1% rate change
+        }
@@ -0,0 +1,176 @@
+"""
+Monte Carlo pricing of European options on several correlated underlyings
+(basket, spread, best-of and worst-of).
+
+The correlation matrix is factorized once (Cholesky, or eigen decomposition
+for matrices that are only positive semi-definite) and the factor is cached
+per matrix. Terminal prices are simulated chunk by chunk as one matrix
+product Z @ L.T per chunk, so memory only depends on chunk_size.
+"""
+
+import functools
+
+import numpy as np
+
+PAYOFFS = ["basket", "spread", "best_of", "worst_of"]
+
+
+@functools.lru_cache(maxsize=32)
+def _factorize(corr_bytes: bytes, n: int, method: str):
+    """Cached factor L such that L @ L.T equals the correlation matrix."""
+    corr = np.frombuffer(corr_bytes).reshape(n, n)
+    if method == "cholesky":
+        try:
+            factor = np.linalg.cholesky(corr)
+        except np.linalg.LinAlgError:
+            # Matrice estimée non définie positive : on passe aux valeurs propres
+            return _factorize(corr_bytes, n, "eigen")
+    else:
+        eigenvalues, eigenvectors = np.linalg.eigh(corr)
+        factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+        # Valeurs propres négatives mises à zéro : on renormalise la diagonale à 1
+        factor = factor / np.sqrt(np.sum(factor**2, axis=1, keepdims=True))
+    factor.setflags(write=False)
+    return factor
+
+
+class MultiAssetMonteCarlo:
+
+    def __init__(self, S, sigma, q, corr, factorization: str = "cholesky"):
+        """
+        S: array, initial prices of the underlyings
+        sigma: array, volatilities
+        q: array, annualized dividend yields (None for zeros)
+        corr: (n, n) correlation matrix
+        factorization: 'cholesky' (falls back to 'eigen' when the matrix is
+                       not positive definite) or 'eigen'
+        """
+        self.S = np.asarray(S, dtype=float)
+        n = len(self.S)
+        self.sigma = np.broadcast_to(np.asarray(sigma, dtype=float), (n,))
+        self.q = np.zeros(n) if q is None else np.broadcast_to(np.asarray(q, dtype=float), (n,))
+
+        corr = np.ascontiguousarray(corr, dtype=float)
+        if corr.shape != (n, n):
+            raise ValueError(f"corr must be a ({n}, {n}) matrix")
+        if not np.allclose(corr, corr.T) or not np.allclose(np.diag(corr), 1):
+            raise ValueError("corr must be symmetric with a unit diagonal")
+        if factorization not in ["cholesky", "eigen"]:
+            raise ValueError("factorization must be 'cholesky' or 'eigen'")
+        self.corr = corr
+        self.factor = _factorize(corr.tobytes(), n, factorization)
+
+    def _payoff(self, ST, K, payoff, option_type, weights):
+        if payoff == "basket":
+            value = ST @ weights
+        elif payoff == "spread":
+            value = ST[:, 0] - ST[:, 1]
+        elif payoff == "best_of":
+            value = ST.max(axis=1)
+        else:
+            value = ST.min(axis=1)
+
+        if option_type == "call":
+            return np.maximum(value - K, 0)
+        return np.maximum(K - value, 0)
+
+    def pricer(
+        self,
+        K,
+        T,
+        r,
+        n_simulations,
+        payoff="basket",
+        option_type="call",
+        weights=None,
+        antithetic=True,
+        control_variate=True,
+        chunk_size=100_000,
+        seed=None,
+    ):
+        """
+        Monte Carlo price of a European multi-asset option.
+
+        Parameters:
+        - K: float, strike price (0 with 'spread' gives an exchange option)
+        - T: float, time to maturity in years
+        - r: float, annual risk-free rate
+        - n_simulations: int, number of simulated scenarios
+        - payoff: str, 'basket' (sum of weights * S_T), 'spread' (S1_T - S2_T),
+          'best_of' (max S_T) or 'worst_of' (min S_T)
+        - option_type: str, 'call' or 'put'
+        - weights: array, basket weights (defaults to equal weights)
+        - antithetic: bool, pair each draw Z with -Z
+        - control_variate: bool, use the discounted basket value (known
+          expectation) as control variate
+        - chunk_size: int, number of scenarios simulated at once
+        - seed: int, optional, seed of the random generator
+
+        Returns:
+        - dict, 'price' and 'std_error' of the estimate
+        """
+        if payoff not in PAYOFFS:
+            raise ValueError(f"payoff must be one of {PAYOFFS}")
+        if option_type not in ["call", "put"]:
+            raise ValueError("option_type must be 'call' or 'put'")
+        n = len(self.S)
+        if payoff == "spread" and n != 2:
+            raise ValueError("spread options need exactly two underlyings")
+        if weights is None:
+            weights = np.full(n, 1 / n)
+        weights = np.asarray(weights, dtype=float)
+        if payoff == "spread":
+            control_weights = np.array([1.0, -1.0])
+        elif payoff == "basket":
+            control_weights = weights
+        else:
+            control_weights = np.full(n, 1 / n)
+
+        rng = np.random.default_rng(seed)
+        drift = (r - self.q - 0.5 * self.sigma**2) * T
+        diffusion = self.sigma * np.sqrt(T)
+        discount = np.exp(-r * T)
+        control_mean = discount * np.sum(control_weights * self.S * np.exp((r - self.q) * T))
+
+        def simulate(Z):
+            ST = self.S * np.exp(drift + diffusion * Z)
+            X = discount * self._payoff(ST, K, payoff, option_type, weights)
+            Y = discount * (ST @ control_weights)
+            return X, Y
+
+        # Sommes cumulées sur les chunks : X = payoff actualisé, Y = variable de contrôle
+        count = 0
+        sum_x = sum_y = sum_xx = sum_xy = sum_yy = 0.0
+        remaining = n_simulations
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            draws = (size + 1) // 2 if antithetic else size
+            Z = rng.standard_normal((draws, n)) @ self.factor.T
+
+            X, Y = simulate(Z)
+            if antithetic:
+                X_anti, Y_anti = simulate(-Z)
+                X, Y = 0.5 * (X + X_anti), 0.5 * (Y + Y_anti)
+
+            count += len(X)
+            sum_x += X.sum()
+            sum_y += Y.sum()
+            sum_xx += X @ X
+            sum_xy += X @ Y
+            sum_yy += Y @ Y
+            remaining -= size
+
+        mean_x, mean_y = sum_x / count, sum_y / count
+        var_x = max(sum_xx / count - mean_x**2, 0.0)
+        var_y = max(sum_yy / count - mean_y**2, 0.0)
+        cov_xy = sum_xy / count - mean_x * mean_y
+
+        if control_variate and var_y > 0:
+            beta = cov_xy / var_y
+            price = mean_x - beta * (mean_y - control_mean)
+            variance = max(var_x - cov_xy**2 / var_y, 0.0)
+        else:
+            price = mean_x
+            variance = var_x
+
+        return {"price": float(price), "std_error": float(np.sqrt(variance / count))}
@@ -0,0 +1,18 @@
+"""
+Market data wrappers (Yahoo Finance, Alpha Vantage, API Ninjas).
+"""
+
+from optionspricer._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules={"option", "risk_free_rate", "underlying"},
+    attributes={
+        "Option": "option",
+        "Product": "underlying",
+        "MultiCurrencyRiskFreeRate": "risk_free_rate",
+        "USTreasuryRate": "risk_free_rate",
+        "FreeRate": "risk_free_rate",
+        "ProxyRateSource": "risk_free_rate",
+    },
+)
@@ -0,0 +1,108 @@
+import unittest
+import warnings
+from optionspricer.pricer.binomial import BinomialPricer
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+
+
+class TestBinomialPricer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.args = (100, 105, 0.05, 1.0, 0.02, 0.25)  # S, K, r, T, q, sigma
+        cls.bs_call = BlackScholesPricer().price(
+            100, 105, 1.0, 0.05, 0.02, 0.25, "call", "european"
+        )
+        # Put américain de référence : Leisen-Reimer très fin
+        cls.american_put = BinomialPricer.lattice(*cls.args, 4001, "put", "american", "lr")
+
+    def test_lattice_matches_price(self):
+        for option_type in ["call", "put"]:
+            for style in ["european", "american"]:
+                self.assertAlmostEqual(
+                    BinomialPricer.lattice(*self.args, 150, option_type, style),
+                    BinomialPricer.price(*self.args, 150, option_type, style),
+                    places=10,
+                )
+
+    def test_smoothed_trees_converge(self):
+        for tree, delta in [("bbs", 5e-3), ("lr", 1e-4)]:
+            self.assertAlmostEqual(
+                BinomialPricer.lattice(*self.args, 401, "call", "european", tree),
+                self.bs_call,
+                delta=delta,
+            )
+
+    def test_price_to_tolerance(self):
+        for method in ["bbsr", "lr"]:
+            result = BinomialPricer.price_to_tolerance(
+                *self.args, "put", "american", tol=1e-3, method=method
+            )
+            self.assertLess(result["error"], 1e-3)
+            self.assertLess(abs(result["price"] - self.american_put), 2e-3)
+            self.assertLessEqual(result["N"], 401)
+
+    def test_price_to_tolerance_european(self):
+        result = BinomialPricer.price_to_tolerance(
+            *self.args, "call", "european", tol=1e-4, method="lr"
+        )
+        self.assertLess(abs(result["price"] - self.bs_call), 1e-3)
+        self.assertEqual(result["N"] % 2, 1)
+
+    def test_tolerance_not_reached_warns(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = BinomialPricer.price_to_tolerance(
+                *self.args, "put", "american", tol=1e-12, N_max=200
+            )
+        self.assertEqual(len(caught), 1)
+        self.assertLessEqual(result["N"], 200)
+
+    def test_greeks_match_black_scholes(self):
+        # Sans dividende : calculate_greeks ne tient pas compte de q
+        args = (100, 105, 0.05, 1.0, 0.0, 0.25)
+        bs = BlackScholesPricer.calculate_greeks(100, 105, 1.0, 0.05, 0.0, 0.25, "call")
+        for tree in ["crr", "bbs", "lr"]:
+            greeks = BinomialPricer.greeks(*args, 501, "call", "european", tree)
+            self.assertAlmostEqual(greeks["delta"], bs["delta"], delta=1e-3)
+            self.assertAlmostEqual(greeks["gamma"], bs["gamma"], delta=1e-4)
+            self.assertAlmostEqual(greeks["theta"], bs["theta"], delta=1e-4)
+            self.assertAlmostEqual(
+                greeks["price"],
+                BinomialPricer.lattice(*args, 501, "call", "european", tree),
+                places=12,
+            )
+
+    def test_american_put_greeks(self):
+        greeks = BinomialPricer.greeks(*self.args, 501, "put", "american", "bbs")
+        self.assertTrue(-1 < greeks["delta"] < 0)
+        self.assertGreater(greeks["gamma"], 0)
+        # Theta par différences finies sur la maturité
+        bumped = BinomialPricer.lattice(
+            100, 105, 0.05, 1.0 - 1 / 365, 0.02, 0.25, 501, "put", "american", "bbs"
+        )
+        self.assertAlmostEqual(greeks["theta"], bumped - greeks["price"], delta=5e-4)
+
+    def test_greeks_need_three_steps(self):
+        with self.assertRaises(ValueError):
+            BinomialPricer.greeks(*self.args, 2, "put", "american")
+
+    def test_n_max_is_never_exceeded(self):
+        with self.assertRaises(ValueError):
+            BinomialPricer.price_to_tolerance(*self.args, "put", "american", N_start=25, N_max=30)
+        with self.assertRaises(ValueError):
+            BinomialPricer.price_to_tolerance(*self.args, "put", "american", N_start=1)
+        for method in ["bbsr", "lr"]:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                result = BinomialPricer.price_to_tolerance(
+                    *self.args, "put", "american", tol=1e-12, method=method, N_start=25, N_max=150
+                )
+            self.assertLessEqual(result["N"], 150)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            BinomialPricer.price_to_tolerance(*self.args, "put", "american", method="jr")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import numpy as np
+import time
+import threading
+import unittest
+from optionspricer.pricer.binomial import BinomialPricer
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+from optionspricer.pricer.cache import PricingCache
+from optionspricer.pricer.heston import HestonPricer
+from optionspricer.pricer.montecarlo import MonteCarlo
+
+
+class TestPricingCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+
+        def pricer(S, K, T, r=0.05, option_type="call"):
+            self.calls += 1
+            return BlackScholesPricer().price(S, K, T, r, 0.0, 0.2, option_type, "european")
+
+        self.pricer = pricer
+
+    def test_hits_and_positional_keyword_equivalence(self):
+        cache = PricingCache()
+        price = cache.wrap(self.pricer)
+        first = price(100, 100, 1.0)
+        self.assertEqual(price(S=100, K=100, T=1.0, r=0.05), first)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+        self.assertEqual(cache.stats["hit_rate"], 0.5)
+
+    def test_quantized_inputs(self):
+        cache = PricingCache(ticks={"S": 0.01})
+        price = cache.wrap(self.pricer)
+        self.assertEqual(price(100.001, 100, 1.0), price(99.998, 100, 1.0))
+        self.assertEqual(self.calls, 1)
+        # Prix calculé sur la grille
+        self.assertEqual(price(100.001, 100, 1.0), self.pricer(100.0, 100, 1.0))
+        price(100.01, 100, 1.0)
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_lru_eviction(self):
+        cache = PricingCache(maxsize=2)
+        price = cache.wrap(self.pricer)
+        price(100, 90, 1.0)
+        price(100, 100, 1.0)
+        price(100, 90, 1.0)  # 90 devient le plus récent
+        price(100, 110, 1.0)  # évince 100
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats["evictions"], 1)
+        price(100, 90, 1.0)
+        self.assertEqual(self.calls, 3)
+        price(100, 100, 1.0)
+        self.assertEqual(self.calls, 4)
+
+    def test_ttl(self):
+        cache = PricingCache(ttl=0.05)
+        price = cache.wrap(self.pricer)
+        price(100, 100, 1.0)
+        price(100, 100, 1.0)
+        time.sleep(0.1)
+        price(100, 100, 1.0)
+        self.assertEqual(self.calls, 2)
+
+    def test_engines_do_not_collide(self):
+        cache = PricingCache()
+        binomial = cache.wrap(BinomialPricer.price)
+        lattice = cache.wrap(BinomialPricer.lattice)
+        args = (100, 100, 0.05, 1.0, 0.0, 0.2, 50, "put", "american")
+        self.assertAlmostEqual(binomial(*args), lattice(*args), places=10)
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_instances_do_not_collide(self):
+        cache = PricingCache()
+        coarse = cache.wrap(HestonPricer(n_terms=8).price)
+        fine = cache.wrap(HestonPricer(n_terms=512).price)
+        args = (100, 100, 1.0, 0.03, 0.0, 0.04, 1.5, 0.04, 0.5, -0.7, "call")
+        coarse(*args)
+        self.assertAlmostEqual(fine(*args), HestonPricer(n_terms=512).price(*args), places=12)
+        self.assertEqual(cache.stats["misses"], 2)
+
+        double = cache.wrap(lambda S: S * 2)
+        triple = cache.wrap(lambda S: S * 3)
+        self.assertEqual((double(1.0), triple(1.0)), (2.0, 3.0))
+
+    def test_shared_engine(self):
+        cache = PricingCache()
+        first = cache.wrap(self.pricer, engine="bs")
+        second = cache.wrap(self.pricer, engine="bs")
+        first(100, 100, 1.0)
+        second(100, 100, 1.0)
+        self.assertEqual(self.calls, 1)
+
+    def test_monte_carlo_greeks_are_copied(self):
+        cache = PricingCache()
+        greeks = cache.wrap(MonteCarlo.greeks)
+        first = greeks(100, 100, 1.0, 0.05, 0.0, 0.2, 10_000, "call")
+        first["delta"] = None
+        second = greeks(100, 100, 1.0, 0.05, 0.0, 0.2, 10_000, "call")
+        self.assertIsNotNone(second["delta"])
+        self.assertEqual(cache.stats["hits"], 1)
+
+    def test_heston_strike_vector_is_copied(self):
+        cache = PricingCache()
+        price = cache.wrap(HestonPricer().price)
+        args = (100, (90.0, 100.0), 1.0, 0.03, 0.0, 0.04, 1.5, 0.04, 0.5, -0.7, "call")
+        first = price(*args)
+        expected = first.copy()
+        first[:] = 0
+        np.testing.assert_array_equal(price(*args), expected)
+        self.assertEqual(cache.stats["hits"], 1)
+
+    def test_numpy_scalars_are_quantized(self):
+        cache = PricingCache(ticks={"S": 5})
+        price = cache.wrap(self.pricer)
+        price(np.int64(101), 100, 1.0)
+        price(np.float64(99.0), 100, 1.0)
+        price(100, 100, 1.0)
+        self.assertEqual(self.calls, 1)
+
+    def test_unhashable_arguments_bypass_cache(self):
+        cache = PricingCache()
+        price = cache.wrap(self.pricer)
+        price(np.array([90.0, 100.0]), 100, 1.0)
+        price(np.array([90.0, 100.0]), 100, 1.0)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_thread_safety(self):
+        cache = PricingCache(maxsize=50, ticks={"S": 1.0})
+        price = cache.wrap(self.pricer)
+        errors = []
+
+        def worker(seed):
+            rng = np.random.default_rng(seed)
+            try:
+                for S in rng.uniform(50, 150, 500):
+                    price(float(S), 100, 1.0)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        stats = cache.stats
+        self.assertEqual(stats["hits"] + stats["misses"], 4000)
+        self.assertLessEqual(stats["size"], 50)
+
+    def test_clear(self):
+        cache = PricingCache()
+        price = cache.wrap(self.pricer)
+        price(100, 100, 1.0)
+        cache.clear()
+        self.assertEqual(cache.stats, {"hits": 0, "misses": 0, "hit_rate": 0.0, "evictions": 0, "size": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import numpy as np
+import unittest
+from scipy.integrate import quad
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+from optionspricer.pricer.heston import HestonCalibrator, HestonPricer
+
+
+class TestHestonPricer(unittest.TestCase):
+
+    def setUp(self):
+        self.pricer = HestonPricer()
+        self.S, self.r, self.q, self.T = 100, 0.03, 0.01, 0.75
+        self.params = dict(v0=0.04, kappa=1.5, theta=0.05, xi=0.6, rho=-0.7)
+        self.strikes = np.array([60, 80, 100, 120, 150.0])
+
+    def reference_call(self, K):
+        # Intégration numérique de la formule d'origine (Heston, 1993)
+        cf = lambda u: self.pricer.characteristic_function(
+            u, self.T, self.r, self.q, **self.params
+        )
+        k = np.log(K / self.S)
+        forward = cf(-1j)
+        P1 = 0.5 + quad(
+            lambda u: np.real(np.exp(-1j * u * k) * cf(u - 1j) / (1j * u * forward)),
+            1e-8, 1000, limit=5000, epsabs=1e-13,
+        )[0] / np.pi
+        P2 = 0.5 + quad(
+            lambda u: np.real(np.exp(-1j * u * k) * cf(u) / (1j * u)),
+            1e-8, 1000, limit=5000, epsabs=1e-13,
+        )[0] / np.pi
+        return self.S * np.exp(-self.q * self.T) * P1 - K * np.exp(-self.r * self.T) * P2
+
+    def test_matches_numerical_integration(self):
+        prices = self.pricer.price(
+            self.S, self.strikes, self.T, self.r, self.q, option_type="call", **self.params
+        )
+        self.assertEqual(prices.shape, self.strikes.shape)
+        for K, price in zip(self.strikes, prices):
+            self.assertAlmostEqual(price, self.reference_call(K), places=5)
+
+    def test_put_call_parity(self):
+        call = self.pricer.price(
+            self.S, self.strikes, self.T, self.r, self.q, option_type="call", **self.params
+        )
+        put = self.pricer.price(
+            self.S, self.strikes, self.T, self.r, self.q, option_type="put", **self.params
+        )
+        parity = self.S * np.exp(-self.q * self.T) - self.strikes * np.exp(-self.r * self.T)
+        np.testing.assert_allclose(call - put, parity, atol=1e-8)
+
+    def test_black_scholes_limit(self):
+        # Variance constante : v0 = theta, vol de vol quasi nulle
+        heston = self.pricer.price(
+            self.S, self.strikes, self.T, self.r, self.q,
+            v0=0.04, kappa=1.0, theta=0.04, xi=1e-3, rho=0.0, option_type="put",
+        )
+        bs = [
+            BlackScholesPricer().price(self.S, K, self.T, self.r, self.q, 0.2, "put", "european")
+            for K in self.strikes
+        ]
+        np.testing.assert_allclose(heston, bs, atol=1e-4)
+
+    def test_scalar_strike(self):
+        price = self.pricer.price(
+            self.S, 100, self.T, self.r, self.q, option_type="call", **self.params
+        )
+        self.assertIsInstance(price, float)
+
+    def test_bates_jumps_raise_otm_put(self):
+        heston = self.pricer.price(
+            self.S, 70, self.T, self.r, self.q, option_type="put", **self.params
+        )
+        bates = self.pricer.price(
+            self.S, 70, self.T, self.r, self.q, option_type="put", **self.params,
+            lam=0.3, mu_j=-0.1, sigma_j=0.15,
+        )
+        self.assertGreater(bates, heston)
+
+
+class TestHestonCalibrator(unittest.TestCase):
+
+    def setUp(self):
+        self.S, self.r, self.q = 100, 0.03, 0.01
+        self.true_params = dict(v0=0.03, kappa=2.0, theta=0.06, xi=0.5, rho=-0.65)
+        pricer = HestonPricer()
+        self.quotes = []
+        for T in [0.1, 0.25, 0.5, 1.0, 2.0]:
+            K = np.linspace(70, 140, 30)
+            prices = pricer.price(self.S, K, T, self.r, self.q, option_type="call", **self.true_params)
+            self.quotes.append((T, K, prices, "call"))
+
+    def test_recovers_parameters(self):
+        calibrator = HestonCalibrator(self.S, self.r, self.q)
+        result = calibrator.calibrate(self.quotes)
+        self.assertLess(result["rmse"], 1e-6)
+        for name, value in self.true_params.items():
+            self.assertAlmostEqual(result[name], value, places=3)
+
+    def test_warm_start(self):
+        calibrator = HestonCalibrator(self.S, self.r, self.q)
+        calibrator.calibrate(self.quotes)
+        self.assertEqual(set(calibrator.params), set(self.true_params))
+        result = calibrator.calibrate(self.quotes)
+        self.assertLess(result["rmse"], 1e-6)
+
+    def test_bates_warm_start_from_heston(self):
+        heston = HestonCalibrator(self.S, self.r, self.q)
+        heston.calibrate(self.quotes)
+        bates = HestonCalibrator(self.S, self.r, self.q, bates=True)
+        result = bates.calibrate(self.quotes, x0=heston.params, max_nfev=20)
+        self.assertIn("lam", result)
+        self.assertTrue(np.isfinite(result["rmse"]))
+
+    def test_zero_weights(self):
+        weights = np.ones(sum(len(K) for _, K, _, _ in self.quotes))
+        weights[:5] = 0
+        result = HestonCalibrator(self.S, self.r, self.q).calibrate(self.quotes, weights=weights)
+        self.assertTrue(np.isfinite(result["rmse"]))
+        self.assertLess(result["rmse"], 1e-4)
+
+    def test_weights_length(self):
+        with self.assertRaises(ValueError):
+            HestonCalibrator(self.S, self.r, self.q).calibrate(self.quotes, weights=np.ones(3))
+
+    def test_quotes_from_chain(self):
+        chain = {
+            "strike": [90.0, 100.0, 110.0],
+            "bid": [11.0, 0.0, 1.0],
+            "ask": [11.4, 0.5, 1.2],
+        }
+        T, K, prices, option_type = HestonCalibrator.quotes_from_chain(chain, 0.5, "call")
+        np.testing.assert_allclose(K, [90.0, 110.0])
+        np.testing.assert_allclose(prices, [11.2, 1.1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import unittest
+
+# Cold import budget (seconds) of the pricing core, numpy included.
+IMPORT_BUDGET = 1.0
+
+HEAVY_MODULES = ["scipy.stats", "pandas", "yfinance", "requests"]
+
+
+def cold_import(statement: str):
+    """Run `statement` in a fresh interpreter, return (elapsed, loaded heavy modules)."""
+    code = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - t0\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    return float(out[0]), [m for m in out[1].split(",") if m] if len(out) > 1 else []
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_package_import_is_lazy(self):
+        _, heavy = cold_import("import optionspricer, optionspricer.pricer, optionspricer.products")
+        self.assertEqual(heavy, [])
+
+    def test_pricers_do_not_load_heavy_dependencies(self):
+        _, heavy = cold_import(
+            "from optionspricer.pricer import BlackScholesPricer, BinomialPricer, MonteCarlo"
+        )
+        self.assertEqual(heavy, [])
+
+    def test_pricing_core_import_budget(self):
+        elapsed = min(
+            cold_import("import optionspricer.pricer.blackscholes")[0] for _ in range(3)
+        )
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_lazy_attributes(self):
+        import optionspricer
+
+        self.assertIn("BlackScholesPricer", dir(optionspricer))
+        pricer = optionspricer.BlackScholesPricer()
+        self.assertAlmostEqual(
+            pricer.price(100, 100, 1.0, 0.05, 0.0, 0.2, "call", "european"),
+            10.4506,
+            places=4,
+        )
+        with self.assertRaises(AttributeError):
+            optionspricer.not_a_pricer
+
+
+if __name__ == "__main__":
+    unittest.main()
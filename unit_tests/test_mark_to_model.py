@@ -0,0 +1,94 @@
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+import unittest
+from optionspricer.mark_to_model import MarkToModel, read_parquet_history, rolling_volatility
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+
+
+class TestMarkToModel(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        index = pd.bdate_range("2023-01-02", periods=300, tz="America/New_York", name="Date")
+        self.history = pd.DataFrame(
+            {"Close": 400 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))}, index=index
+        )
+        self.contracts = [
+            {"id": "C640", "strike": 640, "expiry": "2025-09-19", "option_type": "call"},
+            {"id": "P380", "strike": 380, "expiry": "2023-12-15", "option_type": "put"},
+        ]
+        self.model = MarkToModel(self.contracts, r=0.04, q=0.012, chunk_size=64)
+
+    def test_matches_row_by_row_pricing(self):
+        panel = self.model.run(self.history)
+        self.assertEqual(panel.shape, (300, 12))
+
+        # Même calcul que dans le notebook, ligne par ligne
+        vol = rolling_volatility(self.history["Close"])
+        for date in self.history.index[[20, 100, 250]]:
+            T = (pd.Timestamp("2025-09-19").date() - date.date()).days / 365
+            S = self.history.loc[date, "Close"]
+            greeks = BlackScholesPricer.calculate_greeks(
+                S, 640, T, 0.04, 0.012, vol.loc[date], option_type="call"
+            )
+            price = BlackScholesPricer().price(
+                S, 640, T, 0.04, 0.012, vol.loc[date], "call", "european"
+            )
+            self.assertAlmostEqual(panel.loc[date, ("price", "C640")], price, places=10)
+            for measure, value in greeks.items():
+                self.assertAlmostEqual(panel.loc[date, (measure, "C640")], value, places=10)
+
+    def test_expired_and_warmup_are_nan(self):
+        panel = self.model.run(self.history)
+        self.assertTrue(panel["price"].iloc[:20].isna().all().all())
+        self.assertTrue(panel.loc["2023-12-18":, ("price", "P380")].isna().all())
+        self.assertTrue(panel.loc["2023-12-14", ("price", "P380")] >= 0)
+
+    def test_expiry_date_is_intrinsic(self):
+        panel = self.model.run(self.history)
+        expiry = self.history.index[self.history.index.date == pd.Timestamp("2023-12-15").date()][0]
+        spot = self.history.loc[expiry, "Close"]
+        row = panel.loc[expiry]
+        self.assertEqual(row[("price", "P380")], max(380 - spot, 0))
+        self.assertEqual(row[("delta", "P380")], -1.0 if spot < 380 else 0.0)
+        for measure in ["gamma", "vega", "theta", "rho"]:
+            self.assertEqual(row[(measure, "P380")], 0.0)
+
+    def test_rate_series(self):
+        rates = pd.Series(0.04, index=self.history.index[::5])
+        panel = MarkToModel(self.contracts, r=rates, q=0.012).run(self.history)
+        pd.testing.assert_frame_equal(panel, self.model.run(self.history))
+
+    def test_parquet_stream_matches_frame(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.parquet")
+            self.history.to_parquet(path)
+            streamed = pd.concat(
+                self.model.iter_chunks(read_parquet_history(path, batch_size=50, columns=["Close"]))
+            )
+        expected = self.model.run(self.history)
+        np.testing.assert_allclose(streamed.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+    def test_several_underlyings(self):
+        contracts = [dict(c, underlying="SPY") for c in self.contracts]
+        contracts.append(
+            {"id": "QC500", "strike": 500, "expiry": "2024-03-15", "option_type": "call",
+             "underlying": "QQQ"}
+        )
+        panel = MarkToModel(contracts, r=0.04).run(
+            {"SPY": self.history, "QQQ": self.history * 1.2}
+        )
+        self.assertEqual(list(panel["price"].columns), ["C640", "P380", "QC500"])
+        self.assertTrue(panel[("price", "QC500")].iloc[20:].notna().all())
+
+    def test_invalid_contracts(self):
+        with self.assertRaises(ValueError):
+            MarkToModel([{"id": "X", "strike": 1, "expiry": "2025-01-01", "option_type": "cal"}], r=0.04)
+        with self.assertRaises(ValueError):
+            MarkToModel([{"id": "X", "strike": 1, "option_type": "call"}], r=0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import numpy as np
+import unittest
+from optionspricer.pricer.blackscholes import BlackScholesPricer
+from optionspricer.pricer.montecarlo import MonteCarlo
+
+
+class TestMonteCarloGreeks(unittest.TestCase):
+
+    def setUp(self):
+        self.args = (100, 105, 1.0, 0.05, 0.01, 0.25)  # S, K, T, r, q, sigma
+        self.n_simulations = 400_000
+        # Erreurs absolues tolérées (quelques écarts-types de l'estimateur)
+        self.tolerances = {
+            "price": 0.1, "delta": 0.01, "gamma": 5e-4, "theta": 5e-4, "vega": 0.01, "rho": 0.01,
+        }
+
+    def reference(self, option_type):
+        greeks = BlackScholesPricer.calculate_greeks(*self.args, option_type=option_type)
+        greeks["price"] = BlackScholesPricer().price(*self.args, option_type, "european")
+        # calculate_greeks ignore q dans theta : on le recalcule ici
+        S, K, T, r, q, sigma = self.args
+        price_1d = BlackScholesPricer().price(S, K, T - 1 / 365, r, q, sigma, option_type, "european")
+        greeks["theta"] = price_1d - greeks["price"]
+        return greeks
+
+    def test_greeks_match_black_scholes(self):
+        for option_type in ["call", "put"]:
+            reference = self.reference(option_type)
+            for method in ["pathwise", "likelihood_ratio"]:
+                greeks = MonteCarlo.greeks(
+                    *self.args, self.n_simulations, option_type, method=method, seed=42
+                )
+                for name, tolerance in self.tolerances.items():
+                    self.assertAlmostEqual(
+                        greeks[name], reference[name], delta=tolerance,
+                        msg=f"{option_type} {method} {name}",
+                    )
+
+    def test_same_paths_for_price_and_greeks(self):
+        pathwise = MonteCarlo.greeks(*self.args, 10_000, "call", seed=7)
+        likelihood = MonteCarlo.greeks(*self.args, 10_000, "call", method="likelihood_ratio", seed=7)
+        self.assertEqual(pathwise["price"], likelihood["price"])
+        self.assertEqual(pathwise, MonteCarlo.greeks(*self.args, 10_000, "call", seed=7))
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            MonteCarlo.greeks(*self.args, 1000, "call", method="bump")
+
+
+if __name__ == "__main__":
+    unittest.main()
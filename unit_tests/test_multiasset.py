@@ -0,0 +1,76 @@
+import numpy as np
+import unittest
+from optionspricer.pricer.blackscholes import BlackScholesPricer, norm_cdf
+from optionspricer.pricer.multiasset import MultiAssetMonteCarlo
+
+
+class TestMultiAssetMonteCarlo(unittest.TestCase):
+
+    def test_single_asset_matches_black_scholes(self):
+        engine = MultiAssetMonteCarlo([100], [0.2], [0.01], [[1.0]])
+        for option_type in ["call", "put"]:
+            result = engine.pricer(105, 1.0, 0.03, 200_000, option_type=option_type, seed=1)
+            expected = BlackScholesPricer().price(100, 105, 1.0, 0.03, 0.01, 0.2, option_type, "european")
+            self.assertAlmostEqual(result["price"], expected, delta=4 * result["std_error"] + 1e-3)
+
+    def test_exchange_option_matches_margrabe(self):
+        S1, S2, s1, s2, rho, T, q1, q2 = 100, 95, 0.3, 0.2, 0.4, 1.0, 0.01, 0.02
+        sigma = np.sqrt(s1**2 + s2**2 - 2 * rho * s1 * s2)
+        d1 = (np.log(S1 / S2) + (q2 - q1 + sigma**2 / 2) * T) / (sigma * np.sqrt(T))
+        d2 = d1 - sigma * np.sqrt(T)
+        margrabe = S1 * np.exp(-q1 * T) * norm_cdf(d1) - S2 * np.exp(-q2 * T) * norm_cdf(d2)
+
+        engine = MultiAssetMonteCarlo([S1, S2], [s1, s2], [q1, q2], [[1, rho], [rho, 1]])
+        result = engine.pricer(0, T, 0.03, 200_000, payoff="spread", seed=2)
+        self.assertAlmostEqual(result["price"], margrabe, delta=4 * result["std_error"])
+
+    def test_control_variate_reduces_error(self):
+        corr = np.full((5, 5), 0.6)
+        np.fill_diagonal(corr, 1)
+        engine = MultiAssetMonteCarlo(np.full(5, 100), 0.25, 0.0, corr)
+        plain = engine.pricer(100, 1.0, 0.03, 100_000, control_variate=False, antithetic=False, seed=3)
+        reduced = engine.pricer(100, 1.0, 0.03, 100_000, seed=3)
+        self.assertLess(reduced["std_error"], plain["std_error"] / 2)
+        self.assertAlmostEqual(reduced["price"], plain["price"], delta=4 * plain["std_error"])
+
+    def test_best_of_worst_of_ordering(self):
+        corr = np.full((3, 3), 0.5)
+        np.fill_diagonal(corr, 1)
+        engine = MultiAssetMonteCarlo([100, 100, 100], [0.2, 0.25, 0.3], None, corr)
+        prices = {
+            payoff: engine.pricer(100, 1.0, 0.03, 50_000, payoff=payoff, seed=4)["price"]
+            for payoff in ["best_of", "basket", "worst_of"]
+        }
+        self.assertGreater(prices["best_of"], prices["basket"])
+        self.assertGreater(prices["basket"], prices["worst_of"])
+
+    def test_chunking_is_transparent(self):
+        engine = MultiAssetMonteCarlo([100, 90], [0.2, 0.3], 0.0, [[1, 0.3], [0.3, 1]])
+        one_chunk = engine.pricer(95, 1.0, 0.03, 10_000, chunk_size=10_000, seed=5)
+        many_chunks = engine.pricer(95, 1.0, 0.03, 10_000, chunk_size=1_000, seed=5)
+        self.assertAlmostEqual(one_chunk["price"], many_chunks["price"], delta=0.5)
+
+    def test_factorization_is_cached(self):
+        corr = [[1, 0.2], [0.2, 1]]
+        first = MultiAssetMonteCarlo([100, 100], 0.2, 0.0, corr)
+        second = MultiAssetMonteCarlo([50, 80], 0.3, 0.0, corr)
+        self.assertIs(first.factor, second.factor)
+        np.testing.assert_allclose(first.factor @ first.factor.T, corr)
+
+    def test_not_positive_definite_falls_back_to_eigen(self):
+        corr = np.array([[1, 0.9, -0.9], [0.9, 1, 0.9], [-0.9, 0.9, 1]])
+        engine = MultiAssetMonteCarlo([100] * 3, 0.2, 0.0, corr)
+        np.testing.assert_allclose(np.diag(engine.factor @ engine.factor.T), 1)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            MultiAssetMonteCarlo([100, 100], 0.2, 0.0, [[1, 0.5], [0.4, 1]])
+        engine = MultiAssetMonteCarlo([100] * 3, 0.2, 0.0, np.eye(3))
+        with self.assertRaises(ValueError):
+            engine.pricer(0, 1.0, 0.03, 1000, payoff="spread")
+        with self.assertRaises(ValueError):
+            engine.pricer(100, 1.0, 0.03, 1000, payoff="rainbow")
+
+
+if __name__ == "__main__":
+    unittest.main()